@@ -28,6 +28,18 @@ class Collector:
         if self._throw:
             raise err
 
+    def handle_many(self, errs: Iterable[Exception]):
+        """Handle several exceptions.
+
+        Equivalent to calling `handle` for each one, so if `throw` is set the
+        first exception is raised and any remaining are never produced."""
+
+        if self._throw:
+            for err in errs:
+                self.handle(err)
+        else:
+            self._exceptions.extend(errs)
+
     def exceptions(self):
         return self._exceptions
 
@@ -159,6 +171,13 @@ class SelfInheritanceError(DependencyError):
         super().__init__(file, include, f"Inheritance from self '{include}' in {file}")
 
 
+class CircularDependencyError(DependencyError):
+    def __init__(self, file: str, include: str):
+        self.file = file
+        self.include = include
+        super().__init__(file, include, f"Circular dependency on '{include}' in {file}")
+
+
 class RedundantProfileIncludeError(DependencyError):
     def __init__(self, file: str, include: str):
         self.file = file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,8 @@ from ocsf_validator.types import *
 
 
 class Matcher:
+    __slots__ = ()
+
     def match(self, value: str) -> bool:
         raise NotImplementedError()
 
@@ -15,16 +18,22 @@ class Matcher:
     def make(pattern) -> Matcher:
         if isinstance(pattern, Matcher):
             return pattern
+        elif isinstance(pattern, str):
+            return _regex_matcher(pattern)
         else:
             return RegexMatcher(pattern)
 
 
 class TypeMatcher:
+    __slots__ = ()
+
     def get_type(self) -> type:
         raise NotImplementedError()
 
 
 class AnyMatcher(Matcher):
+    __slots__ = ("_matchers",)
+
     def __init__(self, matchers: Optional[list[Matcher]] = None):
         if matchers is not None:
             self._matchers = matchers
@@ -43,6 +52,8 @@ class AnyMatcher(Matcher):
 
 
 class RegexMatcher(Matcher):
+    __slots__ = ("_pattern",)
+
     def __init__(self, pattern: str | re.Pattern):
         if isinstance(pattern, str):
             self._pattern = re.compile(pattern)
@@ -54,6 +65,8 @@ class RegexMatcher(Matcher):
 
 
 class GlobMatcher(Matcher):
+    __slots__ = ("_pattern",)
+
     def __init__(self, pattern: str):
         self._pattern = pattern
 
@@ -63,38 +76,56 @@ class GlobMatcher(Matcher):
 
 
 class DictionaryMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*dictionary.json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*dictionary.json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfDictionary
 
 
 class VersionMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*version.json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*version.json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfVersion
 
 
 class ObjectMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*objects/.*json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*objects/.*json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfObject
 
 
 class EventMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*events/.*json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*events/.*json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfEvent
 
 
 class ExtensionMatcher(GlobMatcher, TypeMatcher):
+    __slots__ = ()
+
     def __init__(self):
         self._pattern = "extensions/*/extension.json"
 
@@ -103,34 +134,54 @@ class ExtensionMatcher(GlobMatcher, TypeMatcher):
 
 
 class IncludeMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*includes/.*.json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*includes/.*.json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfInclude
 
 
 class ProfileMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*profiles/.*.json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*profiles/.*.json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfProfile
 
 
 class CategoriesMatcher(RegexMatcher, TypeMatcher):
+    __slots__ = ()
+
+    _PATTERN = re.compile(r".*categories.json")
+
     def __init__(self):
-        self._pattern = re.compile(r".*categories.json")
+        self._pattern = self._PATTERN
 
     def get_type(self):
         return OcsfCategories
 
 
+@lru_cache(maxsize=256)
+def _regex_matcher(pattern: str) -> RegexMatcher:
+    """Matchers are stateless, so those made from the same pattern are shared."""
+    return RegexMatcher(pattern)
+
+
 class ExcludeMatcher(Matcher):
     """
     A matcher that produces the opposite result of the matcher it's given.
     """
 
+    __slots__ = ("matcher",)
+
     def __init__(self, matcher: Matcher):
         self.matcher = matcher
 
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import AbstractSet, Any, Callable, Iterator, Optional, Sequence
 
 from ocsf_validator.errors import *
 from ocsf_validator.matchers import CategoriesMatcher, ExcludeMatcher
@@ -13,45 +14,62 @@ from ocsf_validator.types import (
     OcsfDictionary,
     OcsfEvent,
     OcsfObject,
+    schema_desc,
 )
 
+# categories cannot be extended with dependencies, and it causes problems
+# if we try to include dictionary attributes in categories
+_NOT_CATEGORIES = ExcludeMatcher(CategoriesMatcher())
+
 
 def deep_merge(
-    subj: dict[str, Any], other: dict[str, Any], exclude: Optional[set[str]] = None
+    subj: dict[str, Any],
+    other: dict[str, Any],
+    exclude: Optional[AbstractSet[str]] = None,
 ):
-    """Recursive merging of dictionary keys.
+    """Deep merging of dictionary keys.
 
     `subj | other` is more readable, but it doesn't merge recursively. If
     subj and other each have an "attributes" key with a dictionary value,
     only the first "attributes" dictionary will be present in the resulting
-    dictionary. And thus this recursive merge."""
+    dictionary. And thus this deep merge.
+
+    Only the top level of `other` is filtered by `exclude`."""
+
+    skip: AbstractSet[str] = frozenset() if exclude is None else exclude
+    stack = [(subj, other, skip)]
 
-    if exclude is None:
-        skip = set()
-    else:
-        skip = exclude
+    while stack:
+        dest, src, skip = stack.pop()
+        for k, v in src.items():
+            if k in skip:
+                continue
 
-    for k, v in other.items():
-        if k not in skip:
-            if k in subj and isinstance(v, dict):
-                deep_merge(subj[k], other[k])
+            if k not in dest:
+                dest[k] = v
+            elif isinstance(v, dict) and isinstance(dest[k], dict):
+                stack.append((dest[k], v, frozenset()))
 
-            elif k not in subj:
-                subj[k] = other[k]
 
+def _as_list(value: str | list[str]) -> Sequence[str]:
+    """Directives name one target as a string or several as a list."""
+    return (value,) if type(value) is str else value
 
-def exclude_props(t1: type, t2: type):
-    if not hasattr(t1, "__annotations__") or not hasattr(t2, "__annotations__"):
+
+@lru_cache(maxsize=None)
+def exclude_props(t1: type, t2: type) -> frozenset[str]:
+    d1 = schema_desc(t1)
+    d2 = schema_desc(t2)
+    if d1 is None or d2 is None:
         raise Exception("Unexpected types in comparison")
-    s1 = set(t1.__annotations__.keys())
-    s2 = set(t2.__annotations__.keys())
-    return s2 - s1
+    return d2.known - d1.known
 
 
 class DependencyResolver:
     def __init__(self, reader: Reader, types: TypeMapping):
         self._reader = reader
         self._types = types
+        self._includes: dict[tuple[str, str | None], str | None] = {}
 
     def resolve_include(
         self, target: str, relative_to: Optional[str] = None
@@ -63,21 +81,30 @@ class DependencyResolver:
           extn/f.json
           f
           f.json
+
+        Results are remembered per extension for the life of the resolver.
         """
+        extn = None
+        if relative_to is not None:
+            extn = self._types.extension(relative_to)
+
+        key = (target, extn)
+        if key not in self._includes:
+            self._includes[key] = self._resolve_include(target, extn)
+        return self._includes[key]
 
+    def _resolve_include(self, target: str, extn: str | None) -> str | None:
         filenames = [target]
         if Path(target).suffix != ".json":
             filenames.append(target + ".json")
 
         for file in filenames:
-            if relative_to is not None:
+            if extn is not None:
                 # Search extension for relative include path,
                 # e.g. /includes/thing.json -> /extensions/stuff/includes/thing.json
-                extn = self._types.extension(relative_to)
-                if extn is not None:
-                    k = self._reader.key("extensions", extn, file)
-                    if k in self._reader:
-                        return k
+                k = self._reader.key("extensions", extn, file)
+                if k in self._reader:
+                    return k
 
             k = self._reader.key(file)
             if k in self._reader:
@@ -222,10 +249,8 @@ class MergeParser:
 
 class ExtendsParser(MergeParser):
     def applies_to(self, t: type) -> bool:
-        if hasattr(t, "__required_keys__") or hasattr(t, "__optional_keys"):
-            return EXTENDS_KEY in t.__required_keys__ or EXTENDS_KEY in t.__optional_keys__  # type: ignore
-        else:
-            return False
+        desc = schema_desc(t)
+        return desc is not None and EXTENDS_KEY in desc.known
 
     def found_in(self, path: str) -> bool:
         return EXTENDS_KEY in self._reader[path]
@@ -254,25 +279,16 @@ class ExtendsParser(MergeParser):
 
 class ProfilesParser(MergeParser):
     def applies_to(self, t: type) -> bool:
-        if hasattr(t, "__required_keys__") or hasattr(t, "__optional_keys"):
-            return (
-                PROFILES_KEY in t.__required_keys__  # type: ignore
-                or PROFILES_KEY in t.__optional_keys__  # type: ignore
-            )
-        else:
-            return False
+        desc = schema_desc(t)
+        return desc is not None and PROFILES_KEY in desc.known
 
     def found_in(self, path: str) -> bool:
         return PROFILES_KEY in self._reader[path]
 
     def extract_targets(self, path: str) -> list[str]:
         targets = []
-        profiles = self._reader[path][PROFILES_KEY]
 
-        if isinstance(profiles, str):
-            profiles = [profiles]
-
-        for profile in profiles:
+        for profile in _as_list(self._reader[path][PROFILES_KEY]):
             target = self._resolver.resolve_profile(profile, path)
             if target is None:
                 self._collector.handle(MissingProfileError(path, profile))
@@ -284,13 +300,8 @@ class ProfilesParser(MergeParser):
 
 class AttributesParser(MergeParser):
     def applies_to(self, t: type) -> bool:
-        if hasattr(t, "__required_keys__") or hasattr(t, "__optional_keys"):
-            return (
-                ATTRIBUTES_KEY in t.__required_keys__  # type: ignore
-                or ATTRIBUTES_KEY in t.__optional_keys__  # type: ignore
-            )
-        else:
-            return False
+        desc = schema_desc(t)
+        return desc is not None and ATTRIBUTES_KEY in desc.known
 
     def found_in(self, path: str) -> bool:
         return ATTRIBUTES_KEY in self._reader[path]
@@ -332,13 +343,8 @@ class AttributesParser(MergeParser):
 
 class IncludeParser(MergeParser):
     def applies_to(self, t: type) -> bool:
-        return (
-            "__required_keys__" in t.__dict__
-            and INCLUDE_KEY in t.__required_keys__  # type: ignore
-        ) or (
-            "__optional_keys__" in t.__dict__
-            and INCLUDE_KEY in t.__optional_keys__  # type: ignore
-        )
+        desc = schema_desc(t)
+        return desc is not None and INCLUDE_KEY in desc.known
 
     def _has_includes(self, defn: dict[str, Any]) -> bool:
         """Recursively search for $include directives."""
@@ -370,12 +376,7 @@ class IncludeParser(MergeParser):
 
         for k in keys:
             if k == INCLUDE_KEY:
-                if isinstance(defn[k], str):
-                    targets = [defn[k]]
-                else:
-                    targets = defn[k]
-
-                for target in targets:
+                for target in _as_list(defn[k]):
                     t = self._resolver.resolve_include(target, path)
                     found.append(t)
                     if t is None:
@@ -463,36 +464,49 @@ def process_includes(
     fulfilled: set[str] = set()
     dependencies = Dependencies()
 
-    # categories cannot be extended with dependencies, and it causes problems
-    # if we try to include dictionary attributes in categories
-    matcher = ExcludeMatcher(CategoriesMatcher())
-
-    for path in reader.match(matcher):
+    for path in reader.match(_NOT_CATEGORIES):
         for directive, parser in parsers.items():
             if parser.found_in(path):
                 for target in parser.extract_targets(path):
                     dependencies.add(path, target, directive)
 
+    def deps(path: str) -> Iterator[tuple[str, str]]:
+        return iter(dependencies[path] if path in dependencies else ())
+
     def process(path: str):
-        if path not in fulfilled:
-            if path in dependencies:
-                for dependency, directive in dependencies[path]:
-                    if dependency == path:
-                        collector.handle(SelfInheritanceError(path, dependency))
-                    elif directive == INCLUDE_KEY and dependencies.exists(
-                        path, dependency, PROFILES_KEY
-                    ):
-                        collector.handle(RedundantProfileIncludeError(path, dependency))
-                    else:
-                        process(dependency)
+        """Apply `path` after everything it depends on, in depth-first order.
+
+        An explicit stack replaces recursion; the paths on it are the ones
+        still waiting on a dependency, so reaching one again is a cycle."""
+        pending = {path}
+        stack = [(path, deps(path))]
+
+        while stack:
+            current, remaining = stack[-1]
+            for dependency, directive in remaining:
+                if dependency == current:
+                    collector.handle(SelfInheritanceError(current, dependency))
+                elif directive == INCLUDE_KEY and dependencies.exists(
+                    current, dependency, PROFILES_KEY
+                ):
+                    collector.handle(RedundantProfileIncludeError(current, dependency))
+                elif dependency in pending:
+                    collector.handle(CircularDependencyError(current, dependency))
+                elif dependency not in fulfilled:
+                    pending.add(dependency)
+                    stack.append((dependency, deps(dependency)))
+                    break
+            else:
+                stack.pop()
+                pending.discard(current)
 
-            if update:
-                for directive, parser in parsers.items():
-                    if parser.found_in(path):
-                        parser.apply(path)
+                if update:
+                    for directive, parser in parsers.items():
+                        if parser.found_in(current):
+                            parser.apply(current)
 
-            fulfilled.add(path)
+                fulfilled.add(current)
 
     for path in dependencies.keys():
-        # print(path, dependencies[path])
-        process(path)
+        if path not in fulfilled:
+            process(path)
@@ -9,11 +9,14 @@ import json
 from abc import ABC
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
 
 from ocsf_validator.errors import InvalidBasePathError
 from ocsf_validator.matchers import Matcher
 
+if TYPE_CHECKING:
+    from ocsf_validator.type_mapping import TypeMapping
+
 # TODO would os.PathLike be better?
 Pathable = str | Path
 
@@ -23,7 +26,7 @@ SchemaData = Dict[str, Any]
 Pattern = str | Matcher
 
 
-@dataclass
+@dataclass(slots=True)
 class ReaderOptions:
     """Options to control the behavior of a Reader."""
 
@@ -68,6 +71,11 @@ class Reader(ABC):
 
         self._data: SchemaData = {}
         self._root: str = ""
+        self._version: int = 0
+        self._dirs: dict[tuple[str, ...], tuple[set[str], set[str]]] = {}
+        self._dirs_version: int = -1
+        # (version, TypeMapping) cached by `TypeMapping.of`
+        self._type_mapping: Optional[tuple[int, "TypeMapping"]] = None
 
     @property
     def base_path(self):
@@ -77,6 +85,11 @@ class Reader(ABC):
     def metaschema_path(self):
         return self._options.metaschema_path
 
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever files are added or replaced."""
+        return self._version
+
     def contents(self, path: Pathable) -> SchemaData:
         """Retrieve the parsed JSON data in a given file."""
         if isinstance(path, Path):
@@ -100,6 +113,7 @@ class Reader(ABC):
 
     def __setitem__(self, key: str, val: SchemaData):
         self._data[key] = val
+        self._version += 1
 
     def __contains__(self, key: str):
         return key in self._data
@@ -113,18 +127,34 @@ class Reader(ABC):
         if path[0] != "/":
             path = "/" + path
 
-        base = Path(path)
+        listing = self._directories().get(Path(path).parts)
+        if listing is None:
+            return []
 
-        matched = set()
-        for k in self._data.keys():
-            p = Path(k)
-            if p.parts[0 : len(base.parts)] == base.parts:
-                depth = len(base.parts) + 1
-                if (len(p.parts) == depth and files) or (len(p.parts) > depth and dirs):
-                    matched.add(p.parts[len(base.parts)])
+        matched: set[str] = set()
+        if files:
+            matched |= listing[0]
+        if dirs:
+            matched |= listing[1]
 
         return list(matched)
 
+    def _directories(self) -> dict[tuple[str, ...], tuple[set[str], set[str]]]:
+        """Index the files and subdirectories of every directory by path parts.
+
+        The index is rebuilt the first time it is needed after files are
+        added or replaced."""
+        if self._dirs_version != self._version:
+            self._dirs = {}
+            for k in self._data.keys():
+                parts = Path(k).parts
+                for depth in range(1, len(parts)):
+                    entry = self._dirs.setdefault(parts[:depth], (set(), set()))
+                    entry[0 if depth == len(parts) - 1 else 1].add(parts[depth])
+            self._dirs_version = self._version
+
+        return self._dirs
+
     def match(self, pattern: Optional[Pattern] = None) -> Iterable[str]:
         """Return a list of keys that match pattern."""
         if pattern is not None:
@@ -141,6 +171,27 @@ class Reader(ABC):
         for k in self.match(pattern):
             op(self, k)
 
+    def apply_many(self, ops: Iterable[tuple[Callable, Optional[Pattern]]]) -> None:
+        """Apply several functions to the schema with a single pass over its
+        'files'.
+
+        Each function is applied to the files matching its pattern, as with
+        `apply`. Functions run in the order given, each over all of its files,
+        so an earlier function's results are complete before the next runs."""
+
+        ops = list(ops)
+        patterns = [Matcher.make(p) if p is not None else None for _, p in ops]
+        matched: list[list[str]] = [[] for _ in patterns]
+
+        for k in self._data.keys():
+            for pattern, files in zip(patterns, matched):
+                if pattern is None or pattern.match(k):
+                    files.append(k)
+
+        for (op, _), files in zip(ops, matched):
+            for k in files:
+                op(self, k)
+
     def map(
         self,
         op: Callable,
@@ -173,6 +224,7 @@ class DictReader(Reader):
 
     def set_data(self, data: SchemaData):
         self._data = data.copy()
+        self._version += 1
         self._root = Path(next(iter(self._data.keys()))).root
 
 
@@ -2,6 +2,7 @@
 Validate OCSF Schema definitions.
 """
 
+import sys
 import traceback
 from dataclasses import dataclass
 from enum import IntEnum
@@ -15,6 +16,16 @@ from ocsf_validator.processor import process_includes
 from ocsf_validator.reader import FileReader, ReaderOptions
 from ocsf_validator.type_mapping import TypeMapping
 from ocsf_validator.validators import (
+    ATTR_TYPES_ERRORS,
+    EVENT_CATEGORIES_ERRORS,
+    INCLUDE_TARGETS_ERRORS,
+    INTRA_TYPE_COLLISIONS_ERRORS,
+    METASCHEMAS_ERRORS,
+    REQUIRED_KEYS_ERRORS,
+    UNDEFINED_ATTRS_ERRORS,
+    UNKNOWN_KEYS_ERRORS,
+    UNUSED_ATTRS_ERRORS,
+    ValidationContext,
     validate_attr_types,
     validate_event_categories,
     validate_include_targets,
@@ -85,6 +96,9 @@ class ValidatorOptions:
     self_inheritance: int = Severity.WARN
     """Attempting to `extend` the current record."""
 
+    circular_dependency: int = Severity.ERROR
+    """A dependency, directly or indirectly, depends on the current record."""
+
     redundant_profile_include: int = Severity.INFO
     """Redundant profiles and $include target."""
 
@@ -116,7 +130,10 @@ class ValidatorOptions:
     """Unknown category."""
 
     def severity(self, err: Exception):
-        match type(err):
+        return self.severity_from_class(type(err))
+
+    def severity_from_class(self, cls: type):
+        match cls:
             case errors.MissingRequiredKeyError:
                 return self.missing_key
             case errors.UnknownKeyError:
@@ -137,6 +154,8 @@ class ValidatorOptions:
                 return self.imprecise_inheritance
             case errors.SelfInheritanceError:
                 return self.self_inheritance
+            case errors.CircularDependencyError:
+                return self.circular_dependency
             case errors.RedundantProfileIncludeError:
                 return self.redundant_profile_include
             case errors.UndetectableTypeError:
@@ -205,12 +224,34 @@ class ValidationRunner:
                 return self.txt_emphasize("???")
 
     def validate(self) -> None:
+        _FATAL, _ERROR, _WARN, _INFO = (
+            int(Severity.FATAL),
+            int(Severity.ERROR),
+            int(Severity.WARN),
+            int(Severity.INFO),
+        )
         exit_code = 0
         messages: dict[str, dict[int, set[str]]] = {}
+        skipped: set[str] = set()
         collector = errors.Collector(throw=False)
 
-        def test(label: str, code: Callable):
+        def test(label: str, code: Callable, raises: tuple[type, ...] = ()):
             failures: int = 0
+
+            # Don't bother running a test that can only produce messages that
+            # won't be shown. Only tests whose sole output is collector messages
+            # pass `raises`; those that return output to print always run.
+            if (
+                raises
+                and not self.options.show_info
+                and max(self.options.severity_from_class(e) for e in raises) <= _INFO
+            ):
+                messages[label] = {}
+                skipped.add(label)
+                print("")
+                print(self.txt_info("SKIPPED") + ":", self.txt_emphasize(label))
+                return
+
             message = code()
 
             if label not in messages:
@@ -225,12 +266,12 @@ class ValidationRunner:
                     messages[label][severity] = set()
 
                 messages[label][severity].add(str(err))
-                if severity > Severity.INFO or self.options.show_info:
-                    if severity > Severity.INFO:
+                if severity > _INFO or self.options.show_info:
+                    if severity > _INFO:
                         failures += 1
                     print("  ", self.txt_label(severity) + ":", err)
 
-                if severity == Severity.FATAL:
+                if severity == _FATAL:
                     exit(2)
 
             if failures == 0:
@@ -294,6 +335,7 @@ class ValidationRunner:
                 lambda: validate_include_targets(
                     reader, collector=collector, types=types
                 ),
+                raises=INCLUDE_TARGETS_ERRORS,
             )
 
             process_includes(reader, collector=collector, types=types)
@@ -301,55 +343,71 @@ class ValidationRunner:
             # Any errors since the last test were duplicates; ignore them
             collector.flush()
 
+            context = ValidationContext(reader, types)
+
             # Validate keys
             test(
                 "Required keys are present",
                 lambda: validate_required_keys(
-                    reader, collector=collector, types=types
+                    reader, collector=collector, context=context
                 ),
+                raises=REQUIRED_KEYS_ERRORS,
             )
 
             test(
                 "There are no unrecognized keys",
                 lambda: validate_no_unknown_keys(
-                    reader, collector=collector, types=types
+                    reader, collector=collector, context=context
                 ),
+                raises=UNKNOWN_KEYS_ERRORS,
             )
 
             test(
                 "All attributes in the dictionary are used",
-                lambda: validate_unused_attrs(reader, collector=collector, types=types),
+                lambda: validate_unused_attrs(
+                    reader, collector=collector, context=context
+                ),
+                raises=UNUSED_ATTRS_ERRORS,
             )
 
             test(
                 "All attributes are defined in dictionary.json",
                 lambda: validate_undefined_attrs(
-                    reader, collector=collector, types=types
+                    reader, collector=collector, context=context
                 ),
+                raises=UNDEFINED_ATTRS_ERRORS,
             )
 
             test(
                 "Names are not used multiple times within a record type",
                 lambda: validate_intra_type_collisions(
-                    reader, collector=collector, types=types
+                    reader, collector=collector, context=context
                 ),
+                raises=INTRA_TYPE_COLLISIONS_ERRORS,
             )
 
             test(
                 "Attribute type references are defined",
-                lambda: validate_attr_types(reader, collector=collector, types=types),
+                lambda: validate_attr_types(
+                    reader, collector=collector, context=context
+                ),
+                raises=ATTR_TYPES_ERRORS,
             )
 
             test(
                 "Event class categories are defined",
                 lambda: validate_event_categories(
-                    reader, collector=collector, types=types
+                    reader, collector=collector, context=context
                 ),
+                raises=EVENT_CATEGORIES_ERRORS,
             )
 
             test(
                 "JSON files match their metaschema definitions",
-                lambda: validate_metaschemas(reader, collector=collector, types=types),
+                lambda: validate_metaschemas(
+                    reader, collector=collector, context=context
+                ),
+                raises=METASCHEMAS_ERRORS,
             )
 
         except Exception as err:
@@ -357,29 +415,26 @@ class ValidationRunner:
             traceback.print_exception(err)
 
         finally:
-            print("")
-            print(self.txt_emphasize("SUMMARY"))
+            out = ["", self.txt_emphasize("SUMMARY")]
 
-            failure_threshold = (
-                Severity.ERROR if not self.options.strict else Severity.WARN
-            )
+            failure_threshold = _ERROR if not self.options.strict else _WARN
 
             for k in messages:
+                if k in skipped:
+                    out.append(f"   {self.txt_info('SKIPPED')}: {k}")
+                    continue
+
                 found = False
                 if len(messages[k].items()) > 0:
-                    for sev in [
-                        Severity.FATAL,
-                        Severity.ERROR,
-                        Severity.WARN,
-                        Severity.INFO,
-                    ]:
+                    for sev in [_FATAL, _ERROR, _WARN, _INFO]:
                         if sev in messages[k] and sev >= failure_threshold:
                             found = True
-                            print("  ", self.txt_fail("FAILED") + ":", k)
+                            out.append(f"   {self.txt_fail('FAILED')}: {k}")
                             exit_code = 1
 
                 if not found:
-                    print("  ", self.txt_pass("PASSED") + ":", k)
+                    out.append(f"   {self.txt_pass('PASSED')}: {k}")
 
-            print("")
+            out.append("")
+            sys.stdout.write("\n".join(out) + "\n")
             exit(exit_code)
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 from ocsf_validator.errors import Collector, UndetectableTypeError
@@ -18,13 +19,50 @@ MATCHERS: list = [
 ]
 
 
+def _compile_union(matchers: list) -> tuple[re.Pattern, dict[str, type], list]:
+    """Fold the leading run of regex matchers into one alternation.
+
+    Alternatives are tried in order, so the first group to match is the
+    first matcher that would have matched. Returns the union, the type of
+    each named group, and the matchers left to try one at a time."""
+    groups: dict[str, type] = {}
+    alternatives: list[str] = []
+    i = 0
+    for i, matcher in enumerate(matchers):
+        if not isinstance(matcher, RegexMatcher):
+            break
+        name = f"m{i}"
+        groups[name] = matcher.get_type()
+        alternatives.append(f"(?P<{name}>{matcher._pattern.pattern})")
+    else:
+        i = len(matchers)
+
+    union = "|".join(alternatives) or "(?!)"
+    return re.compile(union), groups, matchers[i:]
+
+
+_UNION, _UNION_TYPES, _REST = _compile_union(MATCHERS)
+
+
 class TypeMapping:
     def __init__(self, reader: Reader, collector: Collector = Collector.default):
         self._reader = reader
         self._collector = collector
         self._mappings: dict[str, type] = {}
+        self._extensions: dict[str, str | None] = {}
         self.update()
 
+    @classmethod
+    def of(cls, reader: Reader) -> "TypeMapping":
+        """Return the mapping for `reader` built with the default collector.
+
+        The mapping is reused by later calls until files are added to or
+        replaced in the reader."""
+        cached = reader._type_mapping
+        if cached is None or cached[0] != reader.version:
+            cached = reader._type_mapping = (reader.version, cls(reader))
+        return cached[1]
+
     def __getitem__(self, path: str) -> type:
         return self._mappings[path]
 
@@ -35,7 +73,10 @@ class TypeMapping:
         return iter(self._mappings)
 
     def _get_type(self, path: str) -> type | None:
-        for matcher in MATCHERS:
+        m = _UNION.match(path)
+        if m is not None:
+            return _UNION_TYPES[m.lastgroup]  # type: ignore[index]
+        for matcher in _REST:
             if matcher.match(path):
                 return matcher.get_type()
         return None
@@ -50,8 +91,10 @@ class TypeMapping:
 
     def extension(self, path: str) -> str | None:
         """Extract the extension name from a given key/filepath."""
-        parts = list(Path(self._reader.key(path)).parts)
-        if "extensions" in parts:
-            return parts[parts.index("extensions") + 1]
-        else:
-            return None
+        if path not in self._extensions:
+            parts = Path(self._reader.key(path)).parts
+            if "extensions" in parts:
+                self._extensions[path] = parts[parts.index("extensions") + 1]
+            else:
+                self._extensions[path] = None
+        return self._extensions[path]
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -174,25 +176,33 @@ class OcsfSchema(TypedDict):
     enums: PerExt[Dict[str, OcsfEnum]]
 
 
+_OCSF_TYPES: frozenset[type] = frozenset(
+    {
+        OcsfEnumMember,
+        OcsfEnum,
+        OcsfDeprecationInfo,
+        OcsfAttr,
+        OcsfExtension,
+        OcsfDictionaryTypes,
+        OcsfDictionary,
+        OcsfCategory,
+        OcsfCategories,
+        OcsfInclude,
+        OcsfProfile,
+        OcsfObject,
+        OcsfEvent,
+    }
+)
+
+
 def is_ocsf_type(t: type):
-    return (
-        t is OcsfEnumMember
-        or t is OcsfEnum
-        or t is OcsfDeprecationInfo
-        or t is OcsfAttr
-        or t is OcsfExtension
-        or t is OcsfDictionaryTypes
-        or t is OcsfDictionary
-        or t is OcsfCategory
-        or t is OcsfCategories
-        or t is OcsfInclude
-        or t is OcsfProfile
-        or t is OcsfObject
-        or t is OcsfEvent
-    )
+    return t in _OCSF_TYPES
 
 
+@lru_cache(maxsize=None)
 def leaf_type(defn: type, prop: str) -> type | None:
+    # TypedDict definitions don't change after import, so the answer for a
+    # given (definition, property) pair can be cached.
     if hasattr(defn, "__annotations__") and prop in defn.__annotations__:
         t = defn.__annotations__[prop]
         if hasattr(t, "__args__"):
@@ -200,3 +210,63 @@ def leaf_type(defn: type, prop: str) -> type | None:
         else:
             return t
     return None
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaDesc:
+    """Facts about a record definition that validators need for every record,
+    computed once per definition instead of by introspecting the TypedDict."""
+
+    required: frozenset[str]
+    """Required keys."""
+
+    known: frozenset[str]
+    """All keys, required or not."""
+
+    child_types: dict[str, type]
+    """OCSF record types of keys whose values are or contain other records."""
+
+    is_dict_of_str: dict[str, bool]
+    """Whether each key in `child_types` is a `Dict[str, ...]` of records."""
+
+    required_flat: bool
+    """Whether no required key holds other records, so that checking the
+    required keys of a record needs no further descent."""
+
+
+def _make_schema_desc(defn: type) -> SchemaDesc:
+    child_types: dict[str, type] = {}
+    is_dict_of_str: dict[str, bool] = {}
+
+    for k, annotation in defn.__annotations__.items():
+        t = leaf_type(defn, k)
+        if t is not None and is_ocsf_type(t):
+            args = getattr(annotation, "__args__", ())
+            if len(args) >= 2:
+                if args[-2] != str:
+                    continue
+                is_dict_of_str[k] = True
+            else:
+                is_dict_of_str[k] = False
+            child_types[k] = t
+
+    return SchemaDesc(
+        required=frozenset(defn.__required_keys__),  # type: ignore
+        known=frozenset(defn.__annotations__),
+        child_types=child_types,
+        is_dict_of_str=is_dict_of_str,
+        required_flat=child_types.keys().isdisjoint(defn.__required_keys__),  # type: ignore
+    )
+
+
+_SCHEMA_DESC: dict[type, SchemaDesc] = {
+    t: _make_schema_desc(t) for t in _OCSF_TYPES | {OcsfVersion}
+}
+
+
+def schema_desc(defn: type) -> SchemaDesc | None:
+    """Describe a record definition, or return None if it isn't a TypedDict."""
+    desc = _SCHEMA_DESC.get(defn)
+    if desc is None and hasattr(defn, "__required_keys__"):
+        desc = _SCHEMA_DESC[defn] = _make_schema_desc(defn)
+    return desc
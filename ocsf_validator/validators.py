@@ -1,19 +1,28 @@
 import json
-from pathlib import Path, PurePath
-from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import jsonschema
 import referencing
 import referencing.exceptions
 
 from ocsf_validator.errors import (
+    CircularDependencyError,
     Collector,
     IllegalObservableTypeIDError,
+    ImpreciseBaseError,
+    IncludeTypeMismatchError,
     InvalidAttributeTypeError,
     InvalidMetaSchemaError,
     InvalidMetaSchemaFileError,
+    MissingBaseError,
+    MissingIncludeError,
+    MissingProfileError,
     MissingRequiredKeyError,
     ObservableTypeIDCollisionError,
+    RedundantProfileIncludeError,
+    SelfInheritanceError,
     TypeNameCollisionError,
     UndefinedAttributeError,
     UndetectableTypeError,
@@ -22,7 +31,6 @@ from ocsf_validator.errors import (
     UnusedAttributeError,
 )
 from ocsf_validator.matchers import (
-    AnyMatcher,
     CategoriesMatcher,
     DictionaryMatcher,
     EventMatcher,
@@ -41,10 +49,13 @@ from ocsf_validator.types import (
     OBSERVABLE_KEY,
     OBSERVABLES_KEY,
     TYPES_KEY,
+    OcsfCategories,
+    OcsfDictionary,
     OcsfEvent,
+    OcsfInclude,
     OcsfObject,
-    is_ocsf_type,
-    leaf_type,
+    OcsfProfile,
+    schema_desc,
 )
 
 METASCHEMA_MATCHERS = {
@@ -57,40 +68,251 @@ METASCHEMA_MATCHERS = {
     "extension.schema.json": ExtensionMatcher(),
 }
 
+_CATEGORIES_MATCHER = CategoriesMatcher()
+_DICTIONARY_MATCHER = DictionaryMatcher()
+_EVENT_MATCHER = EventMatcher()
+_OBJECT_MATCHER = ObjectMatcher()
 
-def validate_required_keys(
+_EXCLUDE_KEYS = frozenset({INCLUDE_KEY})
+"""Keys of an attributes section that are not attribute names."""
+
+
+@dataclass
+class ValidationContext:
+    """Schema information shared by validators over a validation run.
+
+    Build one context after includes have been processed and pass it to each
+    validator so that the type mapping and anything else derived from the
+    schema is computed once rather than by every validator.
+    """
+
+    reader: Reader
+    """The schema being validated."""
+
+    types: TypeMapping
+    """The type of each file in the schema."""
+
+    _files: dict[type, list[str]] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        for path in self.types:
+            self._files.setdefault(self.types[path], []).append(path)
+
+    def files_of(self, *types: type) -> list[str]:
+        """Return the files of any of the given types, in schema order."""
+        if len(types) == 1:
+            return self._files.get(types[0], [])
+        return [path for path in self.types if self.types[path] in types]
+
+    @cached_property
+    def dictionary(self) -> Optional[Dict[str, Any]]:
+        """The core dictionary, if there is one."""
+        return self.reader.find("dictionary.json")
+
+    @cached_property
+    def dictionaries(self) -> list[Dict[str, Any]]:
+        """Every dictionary in the schema, including those of extensions."""
+        return [self.reader[f] for f in self.files_of(OcsfDictionary)]
+
+    @cached_property
+    def dictionary_attrs(self) -> frozenset[str]:
+        """Names of the attributes defined across all dictionaries."""
+        attrs: set[str] = set()
+        for d in self.dictionaries:
+            attrs.update(d[ATTRIBUTES_KEY])
+        return frozenset(attrs)
+
+    @cached_property
+    def dictionary_types(self) -> frozenset[str]:
+        """Names of the scalar types defined across all dictionaries."""
+        names: set[str] = set()
+        for d in self.dictionaries:
+            if TYPES_KEY in d:
+                names.update(d[TYPES_KEY][ATTRIBUTES_KEY])
+        return frozenset(names)
+
+    @cached_property
+    def object_names(self) -> frozenset[str]:
+        """Names of all objects in the schema."""
+        return frozenset(
+            self.reader[f]["name"]
+            for f in self.files_of(OcsfObject)
+            if "name" in self.reader[f]
+        )
+
+
+def _get_context(
     reader: Reader,
-    collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
-):
-    """Validate that no required keys are missing."""
+    context: Optional[ValidationContext] = None,
+) -> ValidationContext:
+    if context is None:
+        if types is None:
+            types = TypeMapping.of(reader)
+        context = ValidationContext(reader, types)
+    return context
 
-    if types is None:
-        types = TypeMapping(reader)
 
-    def compare_keys(
-        data: Dict[str, Any], defn: type, file: str, trail: list[str] = []
-    ):
-        if hasattr(defn, "__required_keys__"):
-            for k in defn.__required_keys__:  # type: ignore
-                t = leaf_type(defn, k)
-                if k not in data:
-                    collector.handle(MissingRequiredKeyError(k, file, defn, trail))
-                elif t is not None and is_ocsf_type(t):
-                    if isinstance(data[k], dict):
-                        # dict[str, Ocsf____]
-                        for k2, val in data[k].items():
-                            if k2 != INCLUDE_KEY:
-                                compare_keys(data[k][k2], t, file, trail + [k, k2])
+def _compare_required_keys(
+    record: Dict[str, Any], defn: type, file: str, collector: Collector
+) -> None:
+    """Report required keys missing from `record` or the records it contains."""
+
+    # Walk nested records with an explicit stack of `(data, defn, depth, keys)`
+    # tuples rather than recursion. `depth` is the parent's trail length and
+    # `keys` lead from the parent to the record, so a single trail list is cut
+    # back and extended as entries are popped. To report errors in the order
+    # recursion would, each record's errors and children are queued in
+    # document order and pushed in reverse; errors are handled when popped.
+    stack: list[Any] = [(record, defn, 0, ())]
+    pop = stack.pop
+    handle = collector.handle
+    trail: list[str] = []
+
+    while stack:
+        entry = pop()
+        if type(entry) is not tuple:
+            handle(entry)
+            continue
+
+        data, defn, depth, keys = entry
+        del trail[depth:]
+        trail.extend(keys)
+        depth = len(trail)
+        desc = schema_desc(defn)
+        if desc is None:
+            handle(
+                InvalidMetaSchemaError(
+                    f"Unexpected definition {defn} used when processing {file}"
+                )
+            )
+            continue
+
+        pending: list[Any] = []
+        child_types = desc.child_types
+        for k in desc.required:
+            if k not in data:
+                pending.append(MissingRequiredKeyError(k, file, defn, list(trail)))
+            elif k in child_types:
+                t = child_types[k]
+                value = data[k]
+                if desc.is_dict_of_str[k] and isinstance(value, dict):
+                    # dict[str, Ocsf____]
+                    child = schema_desc(t)
+                    if child is not None and child.required_flat:
+                        # Attributes and the like: check them in place
+                        # rather than pushing each one onto the stack.
+                        required = child.required
+                        for k2, val in value.items():
+                            if k2 not in _EXCLUDE_KEYS:
+                                for k3 in required:
+                                    if k3 not in val:
+                                        pending.append(
+                                            MissingRequiredKeyError(
+                                                k3, file, t, trail + [k, k2]
+                                            )
+                                        )
                     else:
-                        compare_keys(data[k], t, file, trail + [k])
+                        for k2, val in value.items():
+                            if k2 not in _EXCLUDE_KEYS:
+                                pending.append((val, t, depth, (k, k2)))
+                else:
+                    pending.append((value, t, depth, (k,)))
 
-        else:
-            collector.handle(
+        if pending:
+            pending.reverse()
+            stack.extend(pending)
+
+
+def _compare_unknown_keys(
+    record: Dict[str, Any], defn: type, file: str, collector: Collector
+) -> None:
+    """Report keys of `record` or the records it contains that aren't defined."""
+
+    # The same explicit stack walk as `_compare_required_keys`.
+    stack: list[Any] = [(record, defn, 0, ())]
+    pop = stack.pop
+    handle = collector.handle
+    trail: list[str] = []
+
+    while stack:
+        entry = pop()
+        if type(entry) is not tuple:
+            handle(entry)
+            continue
+
+        data, defn, depth, keys = entry
+        del trail[depth:]
+        trail.extend(keys)
+        depth = len(trail)
+        desc = schema_desc(defn)
+        if desc is None or not isinstance(data, dict):
+            handle(
                 InvalidMetaSchemaError(
                     f"Unexpected definition {defn} used when processing {file}"
                 )
             )
+            continue
+
+        known = desc.known
+        child_types = desc.child_types
+        order: list[Any] = []
+        if data.keys() <= known:
+            # Most records have no unknown keys; one subset test confirms it,
+            # and then only the keys holding other records, usually one or
+            # two, need looking at. They are still taken in record order.
+            for k in child_types:
+                if k in data:
+                    order.append(k)
+            if len(order) > 1:
+                order.sort(key=list(data).index)
+        else:
+            # Unknown keys are reported in record order, between the records
+            # held by the keys around them.
+            for k in data:
+                if k not in known:
+                    order.append(UnknownKeyError(k, file, defn, list(trail)))
+                elif k in child_types:
+                    order.append(k)
+
+        pending: list[Any] = []
+        for k in order:
+            if type(k) is not str:
+                pending.append(k)
+                continue
+
+            t = child_types[k]
+            value = data[k]
+            if desc.is_dict_of_str[k]:
+                for k2, val in value.items():
+                    if k2 not in _EXCLUDE_KEYS:
+                        pending.append((val, t, depth, (k, k2)))
+            else:
+                pending.append((value, t, depth, (k,)))
+
+        if pending:
+            pending.reverse()
+            stack.extend(pending)
+
+
+REQUIRED_KEYS_ERRORS = (
+    MissingRequiredKeyError,
+    InvalidMetaSchemaError,
+    UndetectableTypeError,
+)
+"""The errors `validate_required_keys` can report."""
+
+
+def validate_required_keys(
+    reader: Reader,
+    collector: Collector = Collector.default,
+    types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
+):
+    """Validate that no required keys are missing."""
+
+    context = _get_context(reader, types, context)
+    types = context.types
 
     def validate(reader: Reader, file: str):
         record = reader[file]
@@ -98,54 +320,32 @@ def validate_required_keys(
             collector.handle(UndetectableTypeError(file))
         else:
             defn = types[file]
-            if not hasattr(defn, "__annotations__"):
+            if schema_desc(defn) is None:
                 collector.handle(InvalidMetaSchemaError(f"{defn} is not a TypedDict"))
-            compare_keys(record, defn, file)
+                return
+            _compare_required_keys(record, defn, file, collector)
 
     reader.apply(validate)
 
 
+UNKNOWN_KEYS_ERRORS = (
+    UnknownKeyError,
+    InvalidMetaSchemaError,
+    UndetectableTypeError,
+)
+"""The errors `validate_no_unknown_keys` can report."""
+
+
 def validate_no_unknown_keys(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ):
     """Validate that there are no unknown keys."""
 
-    if types is None:
-        types = TypeMapping(reader)
-
-    def compare_keys(
-        data: Dict[str, Any], defn: type, file: str, trail: list[str] = []
-    ):
-        if hasattr(defn, "__annotations__") and isinstance(data, dict):
-            for k in data.keys():
-                t = leaf_type(defn, k)
-                if t is None:
-                    collector.handle(UnknownKeyError(k, file, defn, trail))
-                elif is_ocsf_type(t):
-                    if hasattr(defn.__annotations__[k], "__args__"):
-                        args = defn.__annotations__[k].__args__
-                        if len(args) >= 2:
-                            if args[-2] == str:
-                                for k2, val in data[k].items():
-                                    if k2 != INCLUDE_KEY:
-                                        compare_keys(
-                                            data[k][k2], t, file, trail + [k, k2]
-                                        )
-                            else:
-                                ...  # what would this be?
-                        else:
-                            compare_keys(data[k], args[-1], file, trail + [k])
-                    else:
-                        compare_keys(data[k], t, file, trail + [k])
-
-        else:
-            collector.handle(
-                InvalidMetaSchemaError(
-                    f"Unexpected definition {defn} used when processing {file}"
-                )
-            )
+    context = _get_context(reader, types, context)
+    types = context.types
 
     def validate(reader: Reader, file: str):
         record = reader[file]
@@ -153,13 +353,28 @@ def validate_no_unknown_keys(
             collector.handle(UndetectableTypeError(file))
         else:
             defn = types[file]
-            if not hasattr(defn, "__annotations__"):
+            if schema_desc(defn) is None:
                 collector.handle(InvalidMetaSchemaError(f"{defn} is not a TypedDict"))
-            compare_keys(record, defn, file)
+                return
+            _compare_unknown_keys(record, defn, file, collector)
 
     reader.apply(validate)
 
 
+INCLUDE_TARGETS_ERRORS = (
+    MissingIncludeError,
+    MissingProfileError,
+    MissingBaseError,
+    ImpreciseBaseError,
+    IncludeTypeMismatchError,
+    SelfInheritanceError,
+    CircularDependencyError,
+    RedundantProfileIncludeError,
+    UndetectableTypeError,
+)
+"""The errors `validate_include_targets` can report."""
+
+
 def validate_include_targets(
     reader: Reader,
     collector: Collector = Collector.default,
@@ -168,115 +383,122 @@ def validate_include_targets(
     process_includes(reader, collector=collector, types=types, update=False)
 
 
+UNUSED_ATTRS_ERRORS = (UnusedAttributeError,)
+"""The errors `validate_unused_attrs` can report."""
+
+
 def validate_unused_attrs(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ):
-    if types is None:
-        types = TypeMapping(reader)
-
-    # TODO: Lift validate() function out and use a TypeMapping
-    def make_validator(defn: type):
-        def validate(reader: Reader, key: str, accum: set[str]):
-            record = reader[key]
-            if ATTRIBUTES_KEY in record:
-                return accum | set(
-                    [k for k in record[ATTRIBUTES_KEY]]
-                )  # should it be defn[attrs][k]['name'] ?
-            else:
-                return accum
+    context = _get_context(reader, types, context)
+
+    d = context.dictionary
+    if d is None:
+        return
 
-        return validate
+    attrs: set[str] = set()
+    for file in context.files_of(OcsfObject, OcsfEvent):
+        # should it be defn[attrs][k]['name'] ?
+        attrs.update(reader[file].get(ATTRIBUTES_KEY) or ())
 
-    attrs = reader.map(make_validator(OcsfObject), ObjectMatcher(), set())
-    attrs |= reader.map(make_validator(OcsfEvent), EventMatcher(), set())
+    for k in d[ATTRIBUTES_KEY]:
+        if k not in attrs:
+            collector.handle(UnusedAttributeError(k))
 
-    d = reader.find("dictionary.json")
 
-    if d is not None:
-        for k in d[ATTRIBUTES_KEY]:
-            if k not in attrs:
-                collector.handle(UnusedAttributeError(k))
+UNDEFINED_ATTRS_ERRORS = (
+    UndefinedAttributeError,
+    InvalidMetaSchemaError,
+)
+"""The errors `validate_undefined_attrs` can report."""
 
 
 def validate_undefined_attrs(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ):
-    if types is None:
-        types = TypeMapping(reader)
-
-    EXCLUDE = ["$include"]
+    context = _get_context(reader, types, context)
 
-    dicts = []
-    for d in reader.match(DictionaryMatcher()):
-        dicts.append(reader[d])
-
-    if len(dicts) == 0:
+    if not context.dictionaries:
         collector.handle(InvalidMetaSchemaError())
+        return
+
+    known_attrs = context.dictionary_attrs
 
     def validate(reader: Reader, file: str):
-        record = reader[file]
-        if ATTRIBUTES_KEY in record:
-            for k in record[ATTRIBUTES_KEY]:
-                found = False
-                for d in dicts:
-                    if k in d[ATTRIBUTES_KEY]:
-                        found = True
-
-                if found is False and k not in EXCLUDE:
-                    collector.handle(UndefinedAttributeError(k, file))
-
-    reader.apply(
-        validate,
-        AnyMatcher(
-            [ObjectMatcher(), EventMatcher(), ProfileMatcher(), IncludeMatcher()]
-        ),
-    )
+        attrs = reader[file].get(ATTRIBUTES_KEY)
+        if attrs:
+            undefined = [
+                k for k in attrs if k not in known_attrs and k not in _EXCLUDE_KEYS
+            ]
+            for k in undefined:
+                collector.handle(UndefinedAttributeError(k, file))
+
+    for file in context.files_of(OcsfObject, OcsfEvent, OcsfProfile, OcsfInclude):
+        validate(reader, file)
+
+
+INTRA_TYPE_COLLISIONS_ERRORS = (TypeNameCollisionError,)
+"""The errors `validate_intra_type_collisions` can report."""
 
 
 def validate_intra_type_collisions(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ):
-    if types is None:
-        types = TypeMapping(reader)
+    context = _get_context(reader, types, context)
+    types = context.types
 
-    found: dict[str, dict[str, list[str]]] = {}
+    # The first file seen with each type and name
+    found: dict[tuple[type, str], str] = {}
 
     def validate(reader: Reader, file: str):
-        t = str(types[file])
-        if t not in found:
-            found[t] = {}
+        record = reader[file]
 
         # The patch extends case _always_ has the the same name as its base
-        if "name" in reader[file] and not _is_patch_extends(reader[file]):
-            name = reader[file]["name"]
-            if name not in found[t]:
-                found[t][name] = []
-            else:
-                collector.handle(
-                    TypeNameCollisionError(name, t, file, found[t][name][0])
-                )
-            found[t][name].append(file)
+        if "name" in record and not _is_patch_extends(record):
+            t = types[file]
+            name = record["name"]
+            first = found.setdefault((t, name), file)
+            if first != file:
+                collector.handle(TypeNameCollisionError(name, str(t), file, first))
+
+    for file in context.files_of(OcsfObject, OcsfEvent):
+        validate(reader, file)
+
 
-    reader.apply(validate, AnyMatcher([ObjectMatcher(), EventMatcher()]))
+@lru_cache(maxsize=32)
+def _load_metaschema(path: str, mtime: float) -> Dict[str, Any]:
+    """Load a metaschema file, reusing the result until the file changes."""
+    with open(path) as file:
+        return json.load(file)
 
 
 def _default_get_registry(reader: Reader, base_uri: str) -> referencing.Registry:
-    registry: referencing.Registry = referencing.Registry()
+    resources = []
 
     for schema_file_path in reader.metaschema_path.glob("*.schema.json"):  # type: ignore
-        with open(schema_file_path, "r") as file:
-            schema = json.load(file)
-            resource = referencing.Resource.from_contents(schema)  # type: ignore
-            registry = registry.with_resource(
-                base_uri + schema_file_path.name, resource=resource
-            )
-    return registry
+        schema = _load_metaschema(
+            str(schema_file_path), schema_file_path.stat().st_mtime
+        )
+        resource = referencing.Resource.from_contents(schema)  # type: ignore
+        resources.append((base_uri + schema_file_path.name, resource))
+
+    return referencing.Registry().with_resources(resources)
+
+
+METASCHEMAS_ERRORS = (
+    InvalidMetaSchemaError,
+    InvalidMetaSchemaFileError,
+)
+"""The errors `validate_metaschemas` can report."""
 
 
 def validate_metaschemas(
@@ -284,9 +506,9 @@ def validate_metaschemas(
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
     get_registry: Callable[[Reader, str], referencing.Registry] = _default_get_registry,
+    context: Optional[ValidationContext] = None,
 ) -> None:
-    if types is None:
-        types = TypeMapping(reader)
+    context = _get_context(reader, types, context)
 
     base_uri = "https://schemas.ocsf.io/"
     registry = get_registry(reader, base_uri)
@@ -303,81 +525,67 @@ def validate_metaschemas(
             )
             continue
 
+        validator = jsonschema.Draft202012Validator(schema, registry=registry)
+
         def validate(reader: Reader, file: str) -> None:
             data = reader.contents(file)
-            validator = jsonschema.Draft202012Validator(schema, registry=registry)
-            errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
-            for error in errors:
-                collector.handle(
-                    InvalidMetaSchemaError(
-                        f"File at {file} does not pass metaschema validation. "
-                        f"Error: {error.message} at JSON path: '{error.json_path}'"
-                    )
+            collector.handle_many(
+                InvalidMetaSchemaError(
+                    f"File at {file} does not pass metaschema validation. "
+                    f"Error: {error.message} at JSON path: '{error.json_path}'"
                 )
+                for error in validator.iter_errors(data)
+            )
+
+        for file in context.files_of(matcher.get_type()):
+            validate(reader, file)
 
-        reader.apply(validate, matcher)
+
+ATTR_TYPES_ERRORS = (
+    InvalidAttributeTypeError,
+    InvalidMetaSchemaError,
+)
+"""The errors `validate_attr_types` can report."""
 
 
 def validate_attr_types(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ) -> None:
-    if types is None:
-        types = TypeMapping(reader)
+    context = _get_context(reader, types, context)
+    types = context.types
 
-    EXCLUDE = ["$include"]
-
-    dicts = []
-    for d in reader.match(DictionaryMatcher()):
-        dicts.append(reader[d])
-
-    if len(dicts) == 0:
+    if not context.dictionaries:
         collector.handle(InvalidMetaSchemaError())
+        return
 
-    ## Build a list of object names
-    def names(reader: Reader, file: str, accum: list[str]) -> list[str]:
-        if "name" in reader[file]:
-            accum.append(reader[file]["name"])
+    scalar_types = context.dictionary_types
+    objects = context.object_names
 
-        return accum
-
-    objects: list[str] = []
-    reader.map(names, ObjectMatcher(), objects)
+    handle = collector.handle
 
     # Validation for each file
     def validate(reader: Reader, file: str):
-        record = reader[file]
-        if ATTRIBUTES_KEY in record:
-            for k in record[ATTRIBUTES_KEY]:
-                if k not in EXCLUDE:
-                    attr = record[ATTRIBUTES_KEY][k]
-                    if "type" in attr:
-                        found = False
-
-                        if attr["type"][-2:] == "_t":
+        attrs = reader[file].get(ATTRIBUTES_KEY)
+        if attrs:
+            for k, attr in attrs.items():
+                if k not in _EXCLUDE_KEYS:
+                    t = attr.get("type")
+                    if t is not None:
+                        if t.endswith("_t"):
                             # Scalar type; check dictionaries.
-                            for d in dicts:
-                                if (
-                                    TYPES_KEY in d
-                                    and attr["type"] in d[TYPES_KEY][ATTRIBUTES_KEY]
-                                ):
-                                    found = True
+                            found = t in scalar_types
                         else:
                             # Object type; check objects in repository.
-                            found = attr["type"] in objects
+                            found = t in objects
 
                         if found is False:
-                            collector.handle(
-                                InvalidAttributeTypeError(attr["type"], k, file)
-                            )
-
-    reader.apply(
-        validate,
-        AnyMatcher(
-            [ObjectMatcher(), EventMatcher(), ProfileMatcher(), IncludeMatcher()]
-        ),
-    )
+                            handle(InvalidAttributeTypeError(t, k, file))
+
+    for file in context.files_of(OcsfObject, OcsfEvent, OcsfProfile, OcsfInclude):
+        validate(reader, file)
 
 
 def validate_observables(
@@ -405,10 +613,9 @@ def observables_to_string(observables: Dict[Any, List[str]]) -> str:
     # something other than ints
     type_ids = sorted(observables.keys(), key=_lenient_to_int)
     for tid in type_ids:
-        collision = ""
-        if len(observables[tid]) > 1:
-            collision = "💥COLLISION💥 "
-        strs.append(f'   {tid:7} →️ {collision}{", ".join(observables[tid])}')
+        definitions = observables[tid]
+        collision = "💥COLLISION💥 " if len(definitions) > 1 else ""
+        strs.append(f'   {tid:7} →️ {collision}{", ".join(definitions)}')
     return "\n".join(strs)
 
 
@@ -430,46 +637,52 @@ def validate_and_get_observables(
     observables: Dict[Any, List[str]] = {}
 
     def check_collision(type_id: Any, name: str, file: str) -> None:
-        if type_id in observables:
-            definitions = observables[type_id]
+        definitions = observables.setdefault(type_id, [])
+        if definitions:
             collector.handle(
                 ObservableTypeIDCollisionError(type_id, name, definitions, file)
             )
-            definitions.append(name)
-        else:
-            observables[type_id] = [name]
+        definitions.append(name)
 
-    def any_attribute_has_observable(source: Dict[str, Any]) -> bool:
-        # Returns true if any attribute defines an observable
-        if ATTRIBUTES_KEY in source:
-            for item in source[ATTRIBUTES_KEY].values():
-                if OBSERVABLE_KEY in item:
-                    return True
-        return False
+    def attribute_observables(source: Dict[str, Any]) -> list[tuple[str, Any]]:
+        # Returns the attributes that define an observable
+        attrs = source.get(ATTRIBUTES_KEY)
+        if attrs:
+            return [
+                (a_key, item) for a_key, item in attrs.items() if OBSERVABLE_KEY in item
+            ]
+        return []
 
     def check_attributes(
-        source: Dict[str, Any], name_fn: Callable[[str, Dict[str, Any]], str], file: str
+        attrs: list[tuple[str, Any]], prefix: str, suffix: str, file: str
     ):
-        if ATTRIBUTES_KEY in source:
-            for a_key, item in source[ATTRIBUTES_KEY].items():
-                if OBSERVABLE_KEY in item:
-                    check_collision(item[OBSERVABLE_KEY], name_fn(a_key, item), file)
+        # Each attribute is named as prefix + attribute key + suffix
+        for a_key, item in attrs:
+            check_collision(item[OBSERVABLE_KEY], f"{prefix}{a_key}{suffix}", file)
 
     def validate_dictionaries(reader: Reader, file: str) -> None:
-        if TYPES_KEY in reader[file]:
+        record = reader[file]
+        if TYPES_KEY in record:
             check_attributes(
-                reader[file][TYPES_KEY],
-                lambda a_key, item: f'"{a_key}" (Dictionary Type)',
+                attribute_observables(record[TYPES_KEY]),
+                '"',
+                '" (Dictionary Type)',
                 file,
             )
 
         check_attributes(
-            reader[file],
-            lambda a_key, item: f'"{a_key}" (Dictionary Attribute)',
+            attribute_observables(record),
+            '"',
+            '" (Dictionary Attribute)',
             file,
         )
 
     def validate_classes(reader: Reader, file: str) -> None:
+        record = reader[file]
+        attrs = attribute_observables(record)
+        item_name = _item_name(record)
+        record_name = record.get("name")
+
         # Classes do not have top-level "observable" attribute -- you can't specify an
         # entire class as an observable.
 
@@ -477,11 +690,11 @@ def validate_and_get_observables(
         # classes are those that are not a patch extends case, the name isn't
         # "base_class", and class doesn't have a "uid".
         if (
-            not _is_patch_extends(reader[file])
-            and "base_event" != reader[file].get("name")
-            and "uid" not in reader[file]
+            not _is_patch_extends(record)
+            and "base_event" != record_name
+            and "uid" not in record
         ):
-            if any_attribute_has_observable(reader[file]):
+            if attrs:
                 cause = (
                     f"Illegal definition of one or more attributes with"
                     f' "{OBSERVABLE_KEY}" in hidden class, file "{file}": defining'
@@ -492,7 +705,7 @@ def validate_and_get_observables(
                 )
                 collector.handle(IllegalObservableTypeIDError(cause))
 
-            if OBSERVABLES_KEY in reader[file]:
+            if OBSERVABLES_KEY in record:
                 cause = (
                     f'Illegal "{OBSERVABLES_KEY}" definition in hidden class, file'
                     f' "{file}": defining attribute path based observables in a hidden'
@@ -504,33 +717,38 @@ def validate_and_get_observables(
 
         # Check class-specific attributes
         check_attributes(
-            reader[file],
-            lambda a_key, item: f"{_item_name(reader[file])} class: {a_key}"
-            f" (Class-Specific Attribute)",
+            attrs,
+            f"{item_name} class: ",
+            " (Class-Specific Attribute)",
             file,
         )
 
         # Check class-specific attribute path observables
-        if OBSERVABLES_KEY in reader[file]:
-            for attribute_path in reader[file][OBSERVABLES_KEY]:
+        if OBSERVABLES_KEY in record:
+            for attribute_path in record[OBSERVABLES_KEY]:
                 check_collision(
-                    reader[file][OBSERVABLES_KEY][attribute_path],
-                    f"{_item_name(reader[file])} class: {attribute_path}"
+                    record[OBSERVABLES_KEY][attribute_path],
+                    f"{item_name} class: {attribute_path}"
                     f" (Class-Specific Attribute Path)",
                     file,
                 )
 
     def validate_objects(reader: Reader, file: str) -> None:
+        record = reader[file]
+        attrs = attribute_observables(record)
+        item_name = _item_name(record)
+        record_name = record.get("name")
+
         # Special-case: the "observable" object model's type_id enum has the base for
         # observable type_id typically defining 0: "Unknown" and 99: "Other", which are
         # otherwise not defined.
         if (
-            reader[file].get("name") == "observable"
-            and ATTRIBUTES_KEY in reader[file]
-            and "type_id" in reader[file][ATTRIBUTES_KEY]
-            and "enum" in reader[file][ATTRIBUTES_KEY]["type_id"]
+            record_name == "observable"
+            and ATTRIBUTES_KEY in record
+            and "type_id" in record[ATTRIBUTES_KEY]
+            and "enum" in record[ATTRIBUTES_KEY]["type_id"]
         ):
-            enum_dict = reader[file][ATTRIBUTES_KEY]["type_id"]["enum"]
+            enum_dict = record[ATTRIBUTES_KEY]["type_id"]["enum"]
             for observable_type_id_str, enum in enum_dict.items():
                 name = enum.get("caption", f"Observable enum {observable_type_id_str}")
                 check_collision(int(observable_type_id_str), name, file)
@@ -539,11 +757,11 @@ def validate_and_get_observables(
         # objects are those that are not a patch extends case, and the name has a
         # leading underscore.
         if (
-            not _is_patch_extends(reader[file])
-            and "name" in reader[file]
-            and PurePath(reader[file]["name"]).name.startswith("_")
+            not _is_patch_extends(record)
+            and record_name is not None
+            and record_name.rpartition("/")[2].startswith("_")
         ):
-            if OBSERVABLE_KEY in reader[file]:
+            if OBSERVABLE_KEY in record:
                 cause = (
                     f'Illegal "{OBSERVABLE_KEY}" definition in hidden object,'
                     f' file "{file}": defining top-level observable in a hidden'
@@ -553,7 +771,7 @@ def validate_and_get_observables(
                 )
                 collector.handle(IllegalObservableTypeIDError(cause))
 
-            if any_attribute_has_observable(reader[file]):
+            if attrs:
                 cause = (
                     f"Illegal definition of one or more attributes with"
                     f' "{OBSERVABLE_KEY}" in hidden object, file "{file}": defining'
@@ -564,24 +782,28 @@ def validate_and_get_observables(
                 collector.handle(IllegalObservableTypeIDError(cause))
 
         # Check top-level observable -- entire object is an observable
-        if OBSERVABLE_KEY in reader[file]:
+        if OBSERVABLE_KEY in record:
             check_collision(
-                reader[file][OBSERVABLE_KEY],
-                f"{_item_name(reader[file])} (Object)",
+                record[OBSERVABLE_KEY],
+                f"{item_name} (Object)",
                 file,
             )
 
         # Check object-specific attributes
         check_attributes(
-            reader[file],
-            lambda a_key, item: f"{_item_name(reader[file])} object: {a_key}"
-            f" (Object-Specific Attribute)",
+            attrs,
+            f"{item_name} object: ",
+            " (Object-Specific Attribute)",
             file,
         )
 
-    reader.apply(validate_dictionaries, DictionaryMatcher())
-    reader.apply(validate_classes, EventMatcher())
-    reader.apply(validate_objects, ObjectMatcher())
+    reader.apply_many(
+        [
+            (validate_dictionaries, _DICTIONARY_MATCHER),
+            (validate_classes, _EVENT_MATCHER),
+            (validate_objects, _OBJECT_MATCHER),
+        ]
+    )
 
     return observables
 
@@ -611,24 +833,42 @@ def _is_patch_extends(item):
     return name == item.get("extends")
 
 
+EVENT_CATEGORIES_ERRORS = (UnknownCategoryError,)
+"""The errors `validate_event_categories` can report."""
+
+
 def validate_event_categories(
     reader: Reader,
     collector: Collector = Collector.default,
     types: Optional[TypeMapping] = None,
+    context: Optional[ValidationContext] = None,
 ):
+    category_files: Iterable[str]
+    event_files: Iterable[str]
+    if context is None and types is None:
+        # Select by path rather than building a TypeMapping, which would
+        # raise on any file of undetectable type.
+        category_files = reader.match(_CATEGORIES_MATCHER)
+        event_files = reader.match(_EVENT_MATCHER)
+    else:
+        context = _get_context(reader, types, context)
+        category_files = context.files_of(OcsfCategories)
+        event_files = context.files_of(OcsfEvent)
+
     # Initialize categories list with "other" since it isn't defined in categories.json
     categories = {"other"}
 
     def gather_categories(reader: Reader, file: str) -> None:
-        if ATTRIBUTES_KEY in reader[file]:
-            categories.update(reader[file][ATTRIBUTES_KEY].keys())
+        attrs = reader[file].get(ATTRIBUTES_KEY)
+        if attrs:
+            categories.update(attrs.keys())
 
     def validate_classes(reader: Reader, file: str) -> None:
-        if (
-            CATEGORY_KEY in reader[file]
-            and reader[file][CATEGORY_KEY] not in categories
-        ):
-            collector.handle(UnknownCategoryError(reader[file][CATEGORY_KEY], file))
+        record = reader[file]
+        if CATEGORY_KEY in record and record[CATEGORY_KEY] not in categories:
+            collector.handle(UnknownCategoryError(record[CATEGORY_KEY], file))
 
-    reader.apply(gather_categories, CategoriesMatcher())
-    reader.apply(validate_classes, EventMatcher())
+    for file in category_files:
+        gather_categories(reader, file)
+    for file in event_files:
+        validate_classes(reader, file)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 import pytest
 
@@ -7,19 +7,16 @@ from ocsf_validator.processor import *
 from ocsf_validator.reader import DictReader, Reader
 
 
-def attributes(attrs: list = []) -> dict[str, Any]:
-    d = {}
-    for a in attrs:
-        d[a] = {"name": a}
-    return {"attributes": d}
+def attributes(attrs: Iterable[str] = ()) -> dict[str, Any]:
+    return {"attributes": {a: {"name": a} for a in attrs}}
 
 
-def obj(name: str = "object", attrs: list = []) -> dict[str, Any]:
-    return {"name": name, "caption": ""} | attributes(attrs)
+def obj(name: str = "object", attrs: Iterable[str] = ()) -> dict[str, Any]:
+    return {"name": name, "caption": "", "attributes": {a: {"name": a} for a in attrs}}
 
 
-def event(name: str = "event", attrs: list = []) -> dict[str, Any]:
-    return {"name": name, "caption": ""} | attributes(attrs)
+def event(name: str = "event", attrs: Iterable[str] = ()) -> dict[str, Any]:
+    return {"name": name, "caption": "", "attributes": {a: {"name": a} for a in attrs}}
 
 
 def test_include_one():
@@ -217,6 +214,33 @@ def test_attrs_from_dictionary():
 
     process_includes(r)
     assert "thing" in r["/objects/o1.json"]["attributes"]
-    assert r["/objects/o1.json"]["attributes"]["thing"]["name"] is "thing1"
+    assert r["/objects/o1.json"]["attributes"]["thing"]["name"] == "thing1"
     assert "thing2" not in r["/objects/o1.json"]["attributes"]
     assert "requirement" in r["/objects/o1.json"]["attributes"]["thing"]
+
+
+def test_deep_merge():
+    subj = {"a": {"b": {"c": 1}}, "name": "subj"}
+    other = {"a": {"b": {"c": 2, "d": 3}, "e": 4}, "name": "other", "uid": 5}
+    deep_merge(subj, other, exclude={"uid"})
+
+    assert subj == {"a": {"b": {"c": 1, "d": 3}, "e": 4}, "name": "subj"}
+
+
+def test_circular_dependency():
+    a = event("a")
+    a["$include"] = "includes/b.json"
+    b = attributes(["thing"])
+    b["$include"] = "includes/a.json"
+
+    s = {
+        "/events/a.json": a,
+        "/includes/a.json": attributes(["other"]) | {"$include": "events/a.json"},
+        "/includes/b.json": b,
+    }
+
+    r = DictReader()
+    r.set_data(s)
+
+    with pytest.raises(CircularDependencyError):
+        process_includes(r)
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from ocsf_validator.reader import DictReader
@@ -29,3 +32,54 @@ def test_mapping():
     assert tm["/version.json"] is OcsfVersion
     assert tm["/profiles/profile.json"] is OcsfProfile
     assert tm["/extensions/a/profiles/profile.json"] is OcsfProfile
+
+
+def test_mapping_of():
+    r = DictReader()
+    r.set_data({"/objects/object.json": {}})
+    tm = TypeMapping.of(r)
+    assert TypeMapping.of(r) is tm
+
+    r["/events/event.json"] = {}
+    tm2 = TypeMapping.of(r)
+    assert tm2 is not tm
+    assert tm2["/events/event.json"] is OcsfEvent
+
+
+def test_mapping_of_releases_reader():
+    r = DictReader()
+    r.set_data({"/objects/object.json": {}})
+    TypeMapping.of(r)
+
+    ref = weakref.ref(r)
+    del r
+    gc.collect()
+    assert ref() is None
+
+
+def test_mapping_matches_first_matcher():
+    paths = [
+        "/version.json",
+        "/extensions/a/extension.json",
+        "/extensions/a/includes/include.json",
+        "/profiles/objects/profile.json",
+        "/objects/events/object.json",
+        "/README.md",
+    ]
+    r = DictReader()
+    r.set_data({p: {} for p in paths})
+    tm = TypeMapping(r, Collector(throw=False))
+
+    for path in paths:
+        expected = next((m.get_type() for m in MATCHERS if m.match(path)), None)
+        assert (tm[path] if path in tm else None) is expected
+
+
+def test_mapping_extension():
+    r = DictReader()
+    r.set_data({"/extensions/a/objects/object.json": {}, "/objects/object.json": {}})
+    tm = TypeMapping(r)
+
+    assert tm.extension("/extensions/a/objects/object.json") == "a"
+    assert tm.extension("/extensions/a/objects/object.json") == "a"
+    assert tm.extension("/objects/object.json") is None
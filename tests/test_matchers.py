@@ -53,3 +53,5 @@ def test_make_matcher():
     m = Matcher.make(".*thing.json")
 
     assert m.match("thing.json") is True
+    assert Matcher.make(".*thing.json") is m
+    assert Matcher.make(m) is m
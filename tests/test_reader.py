@@ -46,6 +46,29 @@ def test_apply():
     assert r["/extensions/win/objects/win_process.json"]["test"] == True
 
 
+def test_apply_many():
+    r = reader()
+    calls = []
+
+    def mark(label: str):
+        def op(reader: Reader, key: str):
+            calls.append((label, key))
+
+        return op
+
+    r.apply_many(
+        [(mark("events"), GlobMatcher("events/*")), (mark("os"), "/objects/os")]
+    )
+    assert calls == [
+        ("events", "/events/base_event.json"),
+        ("os", "/objects/os.json"),
+    ]
+
+    calls.clear()
+    r.apply_many((mark(m), m) for m in ["/objects/os"])
+    assert calls == [("/objects/os", "/objects/os.json")]
+
+
 def test_find():
     r = reader()
     f = r.find("objects", "os.json")
@@ -63,6 +86,15 @@ def test_map():
     assert matches == 2
 
 
+def test_match():
+    r = reader()
+    m = GlobMatcher("/objects/*")
+    assert list(r.match(m)) == list(r.match(m)) == ["/objects/os.json"]
+
+    r["/objects/api.json"] = {"name": "api"}
+    assert list(r.match(m)) == ["/objects/os.json", "/objects/api.json"]
+
+
 def test_ls():
     r = reader()
 
@@ -85,3 +117,6 @@ def test_ls():
     matches = r.ls("events", dirs=False)
     assert "application" not in matches
     assert "base_event.json" in matches
+
+    r["/objects/new.json"] = {}
+    assert "new.json" in r.ls("objects")
@@ -7,3 +7,17 @@ def test_is_ocsf_type():
     assert is_ocsf_type(OcsfDictionary) is True
     assert is_ocsf_type(OcsfAttr) is True
     assert is_ocsf_type(str) is False
+
+
+def test_schema_desc():
+    desc = schema_desc(OcsfObject)
+    assert desc is not None
+    assert "attributes" in desc.required
+    assert "caption" in desc.known and "caption" not in desc.required
+    assert desc.child_types["attributes"] is OcsfAttr
+    assert desc.is_dict_of_str["attributes"] is True
+    assert desc.child_types["@deprecated"] is OcsfDeprecationInfo
+    assert desc.is_dict_of_str["@deprecated"] is False
+    assert desc.required_flat is False
+    assert schema_desc(OcsfAttr).required_flat is True  # type: ignore
+    assert schema_desc(str) is None
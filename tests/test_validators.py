@@ -1,3 +1,7 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
 import pytest
 
 from ocsf_validator.reader import DictReader, ReaderOptions
@@ -14,12 +18,23 @@ d1 = {
 }
 
 
-def test_required_keys():
+@pytest.fixture(scope="module")
+def reader_d1() -> DictReader:
     r = DictReader()
     r.set_data(d1)
+    return r
 
-    with pytest.raises(MissingRequiredKeyError):
-        validate_required_keys(r)
+
+@pytest.mark.parametrize(
+    "validator,error",
+    [
+        (validate_required_keys, MissingRequiredKeyError),
+        (validate_no_unknown_keys, UnknownKeyError),
+    ],
+)
+def test_d1_keys(reader_d1, validator, error):
+    with pytest.raises(error):
+        validator(reader_d1)
 
 
 def test_deep_required_keys():
@@ -39,15 +54,43 @@ def test_deep_required_keys():
 
     with pytest.raises(MissingRequiredKeyError) as exc:
         validate_required_keys(r)
-    assert exc.value.key is "caption"
+    assert exc.value.key == "caption"
 
 
-def test_unknown_keys():
+def test_key_error_order():
     r = DictReader()
-    r.set_data(d1)
+    r.set_data(
+        {
+            "/objects/thing.json": {
+                "name": "thing",
+                "bogus0": 1,
+                "attributes": {
+                    "a1": {"bogus1": 1},
+                    "a2": {"bogus2": 1, "caption": "Two"},
+                    "a3": {"bogus3": 1},
+                },
+                "bogus4": 1,
+            },
+        }
+    )
 
-    with pytest.raises(UnknownKeyError):
-        validate_no_unknown_keys(r)
+    # errors are reported in document order, as a recursive walk would
+    collector = Collector(throw=False)
+    validate_no_unknown_keys(r, collector=collector)
+    assert [e.key for e in collector.exceptions()] == [
+        "bogus0",
+        "bogus1",
+        "bogus2",
+        "bogus3",
+        "bogus4",
+    ]
+
+    collector = Collector(throw=False)
+    validate_required_keys(r, collector=collector)
+    assert [e.trail for e in collector.exceptions()] == [
+        ["attributes", "a1"],
+        ["attributes", "a3"],
+    ]
 
 
 def test_validate_unused_attrs():
@@ -178,144 +221,153 @@ def test_validate_attr_keys():
         validate_attr_types(r)
 
 
-def test_validate_observables():
-    good_data = {
-        "dictionary.json": {
-            "attributes": {
-                "name": {"caption": "Name", "type": "string_t"},
-                "alpha": {"caption": "Alpha", "type": "string_t"},
-                "beta": {"caption": "Beta", "type": "string_t"},
-                "gamma": {"caption": "Gamma", "type": "gamma_t", "observable": 1},
-                "delta": {"caption": "Delta", "type": "delta_t"},
-            },
-            "types": {
-                "attributes": {
-                    "string_t": {"caption": "String"},
-                    "integer_t": {"caption": "Integer"},
-                    "gamma_t": {
-                        "caption": "Gamma_T",
-                        "type": "string_t",
-                        "type_name": "String",
-                    },
-                    "delta_t": {
-                        "caption": "Delta_T",
-                        "type": "integer_t",
-                        "type_name": "Integer",
-                        "observable": 2,
-                    },
-                },
-            },
-        },
-        "/objects/bird.json": {
-            "name": "bird",
-            "caption": "Bird",
-            "attributes": {
-                "name": {"requirement": "required"},
-                "alpha": {"requirement": "required"},
-            },
-        },
-        "/objects/cat.json": {
-            "name": "cat",
-            "caption": "Cat",
-            "observable": 10,
-            "attributes": {
-                "name": {"requirement": "required"},
-                "alpha": {"requirement": "required"},
-            },
+def _overlay(base: dict[str, Any], keys: list[str], value: Any) -> dict[str, Any]:
+    """Copy `base` with `value` set at the nested `keys`, copying only the
+    dictionaries along that path and sharing everything else."""
+    key = keys[0]
+    if len(keys) > 1:
+        value = _overlay(base[key], keys[1:], value)
+    return base | {key: value}
+
+
+observables_data = {
+    "dictionary.json": {
+        "attributes": {
+            "name": {"caption": "Name", "type": "string_t"},
+            "alpha": {"caption": "Alpha", "type": "string_t"},
+            "beta": {"caption": "Beta", "type": "string_t"},
+            "gamma": {"caption": "Gamma", "type": "gamma_t", "observable": 1},
+            "delta": {"caption": "Delta", "type": "delta_t"},
         },
-        "/objects/dog.json": {
-            "name": "dog",
-            "caption": "Dog",
+        "types": {
             "attributes": {
-                "name": {"requirement": "required"},
-                "alpha": {"requirement": "required", "observable": 11},
+                "string_t": {"caption": "String"},
+                "integer_t": {"caption": "Integer"},
+                "gamma_t": {
+                    "caption": "Gamma_T",
+                    "type": "string_t",
+                    "type_name": "String",
+                },
+                "delta_t": {
+                    "caption": "Delta_T",
+                    "type": "integer_t",
+                    "type_name": "Integer",
+                    "observable": 2,
+                },
             },
         },
-        "/objects/dog_house.json": {
-            "name": "dog_house",
-            "caption": "Dog House",
-            "attributes": {"tenant": {"type": "dog", "requirement": "required"}},
-            "observables": {"dog.name": 12},
+    },
+    "/objects/bird.json": {
+        "name": "bird",
+        "caption": "Bird",
+        "attributes": {
+            "name": {"requirement": "required"},
+            "alpha": {"requirement": "required"},
         },
-        "/events/blue.json": {
-            "uid": 1,
-            "name": "blue",
-            "caption": "Blue",
+    },
+    "/objects/cat.json": {
+        "name": "cat",
+        "caption": "Cat",
+        "observable": 10,
+        "attributes": {
+            "name": {"requirement": "required"},
+            "alpha": {"requirement": "required"},
         },
-        "/events/green.json": {
-            "uid": 2,
-            "name": "green",
-            "caption": "Green",
+    },
+    "/objects/dog.json": {
+        "name": "dog",
+        "caption": "Dog",
+        "attributes": {
+            "name": {"requirement": "required"},
+            "alpha": {"requirement": "required", "observable": 11},
         },
-        "/events/red.json": {
-            "uid": 3,
-            "name": "red",
-            "caption": "Red",
-            "attributes": {"beta": {"requirement": "required", "observable": 100}},
-        },
-        "/events/yellow.json": {
-            "uid": 4,
-            "name": "yellow",
-            "caption": "Yellow",
-            "attributes": {"bird": {"requirement": "required"}},
-            "observables": {"bird.name": 101},
-        },
-    }
+    },
+    "/objects/dog_house.json": {
+        "name": "dog_house",
+        "caption": "Dog House",
+        "attributes": {"tenant": {"type": "dog", "requirement": "required"}},
+        "observables": {"dog.name": 12},
+    },
+    "/events/blue.json": {
+        "uid": 1,
+        "name": "blue",
+        "caption": "Blue",
+    },
+    "/events/green.json": {
+        "uid": 2,
+        "name": "green",
+        "caption": "Green",
+    },
+    "/events/red.json": {
+        "uid": 3,
+        "name": "red",
+        "caption": "Red",
+        "attributes": {"beta": {"requirement": "required", "observable": 100}},
+    },
+    "/events/yellow.json": {
+        "uid": 4,
+        "name": "yellow",
+        "caption": "Yellow",
+        "attributes": {"bird": {"requirement": "required"}},
+        "observables": {"bird.name": 101},
+    },
+}
 
-    observables = validate_and_get_observables(DictReader(good_data))
+
+def test_validate_observables():
+    observables = validate_and_get_observables(DictReader(observables_data))
     assert observables is not None
     assert len(observables) == 6
     print("\ntest_validate_observables - collected observables:")
     print(observables_to_string(observables))
 
-    with pytest.raises(IllegalObservableTypeIDError):
-        bad_data = dict(good_data)
-        bad_data["/objects/_hidden.json"] = {
-            "name": "_hidden",
-            "caption": "Hidden",
-            "observable": 1,
-        }
-        validate_observables(DictReader(bad_data))
-
-    with pytest.raises(IllegalObservableTypeIDError):
-        bad_data = dict(good_data)
-        bad_data["/objects/_hidden.json"] = {
-            "name": "_hidden",
-            "caption": "Hidden",
-            "attributes": {"beta": {"requirement": "required", "observable": 1}},
-        }
-        validate_observables(DictReader(bad_data))
-
-    with pytest.raises(IllegalObservableTypeIDError):
-        bad_data = dict(good_data)
-        bad_data["/events/_hidden.json"] = {
-            "name": "hidden",
-            "caption": "Hidden",
-            "attributes": {"beta": {"requirement": "required", "observable": 1}},
-        }
-        validate_observables(DictReader(bad_data))
 
-    with pytest.raises(ObservableTypeIDCollisionError):
-        bad_data = dict(good_data)
-        dictionary_attributes = bad_data["dictionary.json"]["attributes"]
-        dictionary_attributes["epsilon"] = {
-            "caption": "Epsilon",
-            "type": "string_t",
-            "observable": 1,
-        }
-        validate_observables(DictReader(bad_data))
-
-    with pytest.raises(ObservableTypeIDCollisionError):
-        bad_data = dict(good_data)
-        dictionary_types_attributes = bad_data["dictionary.json"]["types"]["attributes"]
-        dictionary_types_attributes["epsilon_t"] = (
+@pytest.mark.parametrize(
+    "keys,value,error",
+    [
+        (
+            ["/objects/_hidden.json"],
+            {"name": "_hidden", "caption": "Hidden", "observable": 1},
+            IllegalObservableTypeIDError,
+        ),
+        (
+            ["/objects/_hidden.json"],
+            {
+                "name": "_hidden",
+                "caption": "Hidden",
+                "attributes": {"beta": {"requirement": "required", "observable": 1}},
+            },
+            IllegalObservableTypeIDError,
+        ),
+        (
+            ["/events/_hidden.json"],
+            {
+                "name": "hidden",
+                "caption": "Hidden",
+                "attributes": {"beta": {"requirement": "required", "observable": 1}},
+            },
+            IllegalObservableTypeIDError,
+        ),
+        (
+            ["dictionary.json", "attributes", "epsilon"],
+            {"caption": "Epsilon", "type": "string_t", "observable": 1},
+            ObservableTypeIDCollisionError,
+        ),
+        (
+            ["dictionary.json", "types", "attributes", "epsilon_t"],
             {
                 "caption": "Epsilon_T",
                 "type": "string_t",
                 "type_name": "String",
                 "observable": 2,
             },
-        )
+            ObservableTypeIDCollisionError,
+        ),
+    ],
+)
+def test_validate_observables_errors(keys, value, error):
+    bad_data = _overlay(observables_data, keys, value)
+    with pytest.raises(error):
         validate_observables(DictReader(bad_data))
 
 
@@ -349,26 +401,35 @@ def test_validate_event_categories():
     with pytest.raises(UnknownCategoryError):
         validate_event_categories(DictReader(bad_data))
 
+    # files of undetectable type are not this validator's concern
+    validate_event_categories(DictReader(good_data | {"README.json": {}}))
 
-def test_validate_metaschemas():
-    # set up a json schema that expects an object with a name property only
-    object_json_schema = {
-        "$id": "https://fake.schema.ocsf.io/object.schema.json",
-        "$schema": "https://json-schema.org/draft/2020-12/schema",
-        "title": "Object",
-        "type": "object",
-        "required": ["name"],
-        "properties": {"name": {"type": "string"}},
-        "additionalProperties": False,
-    }
 
-    def _get_registry(reader, base_uri) -> referencing.Registry:
-        registry: referencing.Registry = referencing.Registry()
-        for schema in METASCHEMA_MATCHERS.keys():
-            resource = referencing.Resource.from_contents(object_json_schema)  # type: ignore
-            registry = registry.with_resource(base_uri + schema, resource=resource)
-        return registry
+# a json schema that expects an object with a name property only
+object_json_schema = {
+    "$id": "https://fake.schema.ocsf.io/object.schema.json",
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "Object",
+    "type": "object",
+    "required": ["name"],
+    "properties": {"name": {"type": "string"}},
+    "additionalProperties": False,
+}
+object_json_resource = referencing.Resource.from_contents(object_json_schema)  # type: ignore
+
+
+@lru_cache(maxsize=4)
+def _object_registry(base_uri: str) -> referencing.Registry:
+    return referencing.Registry().with_resources(
+        (base_uri + schema, object_json_resource) for schema in METASCHEMA_MATCHERS
+    )
+
+
+def _get_registry(reader, base_uri) -> referencing.Registry:
+    return _object_registry(base_uri)
 
+
+def test_validate_metaschemas():
     options = ReaderOptions(base_path=Path(""))
 
     # test that a bad schema fails validation
@@ -396,18 +457,6 @@ def test_validate_metaschemas():
 
     validate_metaschemas(r, get_registry=_get_registry)
 
-    # test that a good schema passes validation
-    r = DictReader(options)
-    r.set_data(
-        {
-            "/objects/thing.json": {
-                "name": "thing",
-            },
-        }
-    )
-
-    validate_metaschemas(r, get_registry=_get_registry)
-
     # test that a missing metaschema file fails validation
     def _get_blank_registry(reader, base_uri):
         registry = referencing.Registry()
@@ -415,3 +464,23 @@ def test_validate_metaschemas():
 
     with pytest.raises(InvalidMetaSchemaFileError) as exc:
         validate_metaschemas(r, get_registry=_get_blank_registry)
+
+
+def test_validation_context_files_of():
+    r = DictReader()
+    r.set_data(
+        {
+            "dictionary.json": {},
+            "objects/a.json": {},
+            "events/b.json": {},
+            "objects/c.json": {},
+        }
+    )
+    context = ValidationContext(r, TypeMapping(r))
+    assert context.files_of(OcsfObject) == ["objects/a.json", "objects/c.json"]
+    assert context.files_of(OcsfEvent, OcsfObject) == [
+        "objects/a.json",
+        "events/b.json",
+        "objects/c.json",
+    ]
+    assert context.files_of(OcsfProfile) == []